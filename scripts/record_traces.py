@@ -10,6 +10,24 @@ Usage:
     # Record a single trace
     uv run python scripts/record_traces.py --run dspy-rlm-run-1
 
+    # Record at most two demos at a time (e.g. to stay under rate limits)
+    uv run python scripts/record_traces.py --jobs 2
+
+    # Re-record even if the demo's inputs haven't changed
+    uv run python scripts/record_traces.py --force
+
+    # Write indented JSON for reading by hand (default is compact)
+    uv run python scripts/record_traces.py --pretty
+
+    # Write compact msgpack traces instead of JSON (requires msgpack)
+    uv run python scripts/record_traces.py --format msgpack
+
+    # Compress traces for archival, e.g. run.json.zst (requires zstandard)
+    uv run python scripts/record_traces.py --compress zstd
+
+    # Gzip traces for serving, e.g. run.json.gz (the browser can inflate these)
+    uv run python scripts/record_traces.py --compress gzip
+
 Requires:
     - DSPy >= 2.6 (uv pip install dspy)
     - API key for the chosen provider
@@ -18,12 +36,61 @@ Requires:
 
 from __future__ import annotations
 
+import argparse
+import contextlib
+import functools
+import gzip
+import hashlib
+import importlib
+import importlib.util
 import json
 import os
+import re
 import sys
 import time
+import traceback
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, ContextManager, Iterator
+
+try:
+    import dspy
+except ImportError:
+    dspy = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from dspy_explorer.rlm_steps import ActionCallback, iter_steps
+from dspy_explorer.trace_data import _TRACE_SUFFIXES
+
+
+# KEY=value lines, with optional matching quotes around the value. Quotes
+# inside the value (e.g. PASS=ab'c) are kept as-is.
+_RENVIRON_LINE_RE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(["']?)(.*?)\2[ \t\r]*$""",
+    re.MULTILINE,
+)
+
+# Sub-LM calls made from the RLM's generated code
+_LLM_CALL_RE = re.compile(r"llm_query(?:_batched)?\(")
+
+# Start of the per-file header lines written by load_package_source
+_FILE_HEADER = "# --- "
+
+
+@functools.cache
+def _parse_renviron(path: str, mtime_ns: int) -> dict[str, str]:
+    """Parse an .Renviron file, memoized on its path and modification time."""
+    parsed: dict[str, str] = {}
+    for key, _quote, value in _RENVIRON_LINE_RE.findall(Path(path).read_text()):
+        value = value.strip()
+        if value:
+            parsed.setdefault(key, value)
+    return parsed
 
 
 def load_env_from_renviron() -> None:
@@ -31,16 +98,9 @@ def load_env_from_renviron() -> None:
     renviron = Path.home() / ".Renviron"
     if not renviron.exists():
         return
-    for line in renviron.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" in line:
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-            if key and value and key not in os.environ:
-                os.environ[key] = value
+    parsed = _parse_renviron(str(renviron), renviron.stat().st_mtime_ns)
+    for key, value in parsed.items():
+        os.environ.setdefault(key, value)
 
 
 def fix_deno_env() -> None:
@@ -53,124 +113,290 @@ def fix_deno_env() -> None:
     os.environ["DENO_NO_PACKAGE_JSON"] = "1"
 
 
-def record_rlm_trace(
+def _cache_key(
     lm_name: str,
+    signature: str,
     question: str,
-    output_path: Path,
-    signature: str = "context, question -> answer",
-    verbose: bool = True,
-    **input_kwargs: Any,
-) -> dict[str, Any]:
-    """Record a single RLM trace and save to JSON.
+    input_kwargs: dict[str, Any],
+) -> str:
+    """Hash everything that determines a recording's result.
 
-    Args:
-        lm_name: litellm-style model string (e.g., "openai/gpt-4o-mini")
-        question: The question for the RLM to answer
-        output_path: Where to save the JSON trace
-        signature: DSPy signature string
-        verbose: Whether to print progress
-        **input_kwargs: Additional input kwargs for the RLM (e.g., context=...)
+    Fields are NUL-separated so that, e.g., a question ending in "|" can't
+    collide with a neighbouring field, and hashed in a single update().
+    """
+    payload = b"\x00".join((
+        lm_name.encode(),
+        signature.encode(),
+        question.encode(),
+        json.dumps(input_kwargs, sort_keys=True, separators=(",", ":")).encode(),
+    ))
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _load_cached_trace(output_path: Path, key: str) -> dict[str, Any] | None:
+    """Return the existing trace at output_path if it was recorded with key."""
+    if not output_path.is_file():
+        return None
+    try:
+        data = output_path.read_bytes()
+        fmt = output_path.suffix
+        if fmt == ".zst":
+            import zstandard
+
+            try:
+                data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+            except zstandard.ZstdError:
+                return None
+            fmt = Path(output_path.stem).suffix
+        elif fmt == ".gz":
+            data = gzip.decompress(data)
+            fmt = Path(output_path.stem).suffix
+        if fmt == ".msgpack":
+            import msgpack
+
+            trace = msgpack.unpackb(data)
+        else:
+            trace = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (ValueError, OSError, EOFError, zlib.error, ImportError):
+        return None
+    return trace if trace.get("cache_key") == key else None
 
-    Returns:
-        The trace dict that was saved
+
+def _dumps(value: Any, pretty: bool = False) -> bytes:
+    """Serialize a value to JSON bytes, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(value, indent=2).encode()
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+class _IterationLog(ActionCallback):
+    """DSPy callback that appends each RLM action to an NDJSON file.
+
+    The RLM only returns its trajectory once it finishes, so this sidecar
+    is what lets a long recording be watched (``tail -f``) as it runs, and
+    what survives if it dies part-way through. Each line holds the
+    iteration's reasoning and code; its REPL output isn't known yet.
     """
-    import dspy
-    from dspy.primitives.repl_types import REPLVariable
 
-    lm = dspy.LM(lm_name)
-    dspy.configure(lm=lm)
+    def __init__(self, path: Path, predictor: Any):
+        super().__init__(predictor, self._write)
+        self.path = path
+        path.write_bytes(b"")
 
-    rlm = dspy.RLM(
-        signature=signature,
-        max_iterations=15,
-        verbose=verbose,
-    )
+    def _write(self, action: dict[str, Any]) -> None:
+        with self.path.open("ab") as f:
+            f.write(_dumps(action) + b"\n")
 
-    # Build inputs
-    inputs: dict[str, Any] = {"question": question, **input_kwargs}
 
-    if verbose:
-        print(f"Running RLM with {lm_name}...")
-        print(f"  Question: {question[:100]}...")
-        print(f"  Inputs: {list(inputs.keys())}")
+def _compressed(f: BinaryIO, suffix: str) -> ContextManager[BinaryIO]:
+    """Wrap f in a compressing writer for a .zst or .gz path, else return it as-is."""
+    if suffix == ".zst":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).stream_writer(f)
+    if suffix == ".gz":
+        # mtime=0 keeps the output byte-identical across re-recordings
+        return gzip.GzipFile(fileobj=f, mode="wb", compresslevel=9, mtime=0)
+    return contextlib.nullcontext(f)
+
+
+def _write_trace(trace: dict[str, Any], path: Path, pretty: bool = False) -> None:
+    """Write a trace to path as msgpack or JSON, based on its suffix.
+
+    A trailing ``.zst`` or ``.gz`` (e.g. ``run.json.gz``) compresses the
+    output with zstd or gzip. JSON is compact unless pretty is set, in which case it is
+    indented by two spaces. Either way it is streamed one iteration at a
+    time rather than built as a single string first.
+
+    The trace is written to a temporary sibling and moved into place, so an
+    interrupted recording never leaves a truncated file at path. If writing
+    fails, the temporary file is removed.
+    """
+    fmt = Path(path.stem).suffix if path.suffix in (".zst", ".gz") else path.suffix
+    if pretty:
+        indent, item_indent, colon = b"\n  ", b"\n    ", b": "
+    else:
+        indent, item_indent, colon = b"", b"", b":"
+
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with tmp.open("wb") as raw, _compressed(raw, path.suffix) as f:
+            if fmt == ".msgpack":
+                import msgpack
+
+                f.write(msgpack.packb(trace, use_bin_type=True))
+            else:
+                f.write(b"{")
+                for i, (key, value) in enumerate(trace.items()):
+                    f.write(b"," if i else b"")
+                    f.write(indent + _dumps(key) + colon)
+                    if key == "iterations" and value:
+                        f.write(b"[")
+                        for j, step in enumerate(value):
+                            f.write(b"," if j else b"")
+                            step_json = _dumps(step, pretty).replace(b"\n", item_indent)
+                            f.write(item_indent + step_json)
+                        f.write(indent + b"]")
+                    else:
+                        f.write(_dumps(value, pretty).replace(b"\n", indent))
+                f.write(b"\n}" if pretty else b"}")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _remove_other_formats(path: Path) -> None:
+    """Delete the traces of path's run in any format other than path's own.
+
+    The app loads a run's trace in the first format of _TRACE_SUFFIXES it
+    finds, so an older recording in another format would hide this one.
+    """
+    run_id, _, _ = path.name.partition(".")
+    for suffix in _TRACE_SUFFIXES:
+        sibling = path.with_name(f"{run_id}{suffix}")
+        if sibling != path:
+            sibling.unlink(missing_ok=True)
+
 
-    start_time = time.time()
-    result = rlm(**inputs)
-    elapsed = time.time() - start_time
+@functools.cache
+def _token_encoding(model: str) -> Any | None:
+    """Return the tiktoken encoding for a litellm-style model string.
 
+    Returns None if tiktoken isn't installed or its BPE file can't be
+    downloaded, so a failed estimate never costs an already-paid recording.
+    """
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(model.rsplit("/", 1)[-1])
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def _estimate_tokens(
+    model: str,
+    question: str,
+    iterations: list[dict[str, Any]],
+) -> dict[str, Any] | None:
+    """Count tokens locally for runs whose provider didn't report usage.
+
+    Only text known to be prompted is counted. The RLM keeps its inputs,
+    including the full context, in the REPL rather than the prompt, so each
+    call's input is the question plus the reasoning and code of the
+    iterations before it; output is each iteration's reasoning and code.
+    The fixed instructions, variable previews and REPL output the RLM also
+    sends aren't seen here, so the totals are a lower bound and flagged as
+    an estimate. Returns None if no tokenizer is available.
+    """
+    enc = _token_encoding(model)
+    if enc is None:
+        return None
+    question_tokens = len(enc.encode_ordinary(question))
+    step_tokens = [
+        len(ids)
+        for ids in enc.encode_ordinary_batch(
+            [step["reasoning"] + step["code"] for step in iterations]
+        )
+    ]
+    total_input = 0
+    history_tokens = 0
+    for n in step_tokens:
+        total_input += question_tokens + history_tokens
+        history_tokens += n
+    return {
+        "input": total_input,
+        "output": history_tokens,
+        "estimated": True,
+    }
+
+
+def build_trace(
+    result: Any,
+    inputs: dict[str, Any],
+    run_id: str,
+    model: str,
+    history: list[dict[str, Any]] | None = None,
+    file_counts: dict[str, int] | None = None,
+) -> dict[str, Any]:
+    """Assemble the explorer's trace dict from a finished RLM prediction.
+
+    Args:
+        result: The prediction returned by the RLM call
+        inputs: The input kwargs the RLM was called with
+        run_id: Identifier for the trace (usually the output file name
+            without its extensions)
+        model: litellm-style model string used for the run
+        history: The LM's call history, used for token usage if available.
+            Without usage data, tokens are estimated with tiktoken.
+        file_counts: Known file counts for inputs built by
+            load_package_source, keyed by input name. Inputs not listed here
+            are scanned for file headers instead.
+
+    Returns:
+        The trace dict in the format consumed by the explorer
+    """
     # Extract trajectory
     trajectory: list[dict[str, str]] = getattr(result, "trajectory", [])
 
     # Build context_variables metadata. Count "# --- pkg/file.py ---" headers
     # to get the real file count (from load_package_source), falling back to 1.
+    file_counts = file_counts or {}
     context_variables = []
     for name, value in inputs.items():
-        value_str = str(value)
-        # Count file headers injected by load_package_source
-        import re as _re
-        n_files = len(_re.findall(r"^# --- .+\.py ---$", value_str, _re.MULTILINE))
-        if n_files == 0:
-            n_files = 1
+        value_str = value if isinstance(value, str) else str(value)
+        size_chars = len(value_str)
+        # Count file headers injected by load_package_source, unless the
+        # caller already knows how many it joined. Short values (questions,
+        # small literals) can't hold a package, so skip the scan.
+        n_files = 1
+        if name in file_counts:
+            n_files = file_counts[name]
+        elif size_chars > 500:
+            n_files = max(
+                1,
+                value_str.count("\n" + _FILE_HEADER)
+                + value_str.startswith(_FILE_HEADER),
+            )
         context_variables.append({
             "name": name,
-            "size_chars": len(value_str),
+            "size_chars": size_chars,
             "n_files": n_files,
         })
 
-    # Detect which iteration has the SUBMIT call
-    def has_submit(code: str) -> bool:
-        return "SUBMIT(" in code
-
-    # Build iterations
+    # Build iterations, counting llm_query calls in the code along the way
     iterations = []
-    for i, step in enumerate(trajectory):
-        code = step.get("code", "")
-        output = step.get("output", "")
-        is_final = has_submit(code) or i == len(trajectory) - 1
-        # Check if the output indicates an error
-        success = not any(
-            marker in output
-            for marker in ["Traceback (most recent call last)", "Error:", "Exception:"]
-        )
-        iterations.append({
-            "iteration": i + 1,
-            "reasoning": step.get("reasoning", ""),
-            "code": code,
-            "output": output,
-            "success": success,
-            "is_final": is_final,
-        })
+    llm_calls = 0
+    for iteration in iter_steps(trajectory):
+        llm_calls += len(_LLM_CALL_RE.findall(iteration["code"]))
+        iterations.append(iteration)
 
     # Try to get token usage from DSPy's LM history
     total_tokens = None
     try:
-        history = lm.history
         if history:
-            total_input = sum(
-                entry.get("usage", {}).get("prompt_tokens", 0)
-                for entry in history
-            )
-            total_output = sum(
-                entry.get("usage", {}).get("completion_tokens", 0)
-                for entry in history
-            )
+            total_input = total_output = 0
+            for entry in history:
+                usage = entry.get("usage") or {}
+                total_input += usage.get("prompt_tokens") or 0
+                total_output += usage.get("completion_tokens") or 0
             if total_input > 0 or total_output > 0:
                 total_tokens = {"input": total_input, "output": total_output}
     except Exception:
         pass
-
-    # Count llm_query calls in the code
-    llm_calls = sum(
-        step.get("code", "").count("llm_query(")
-        + step.get("code", "").count("llm_query_batched(")
-        for step in trajectory
-    )
+    if total_tokens is None:
+        total_tokens = _estimate_tokens(model, inputs.get("question", ""), iterations)
 
     trace = {
-        "run_id": output_path.stem,
+        "run_id": run_id,
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "question": question,
-        "model": lm_name,
+        "question": inputs.get("question", ""),
+        "model": model,
         "context_variables": context_variables,
         "iterations": iterations,
         "final_answer": getattr(result, "answer", str(result)),
@@ -180,10 +406,94 @@ def record_rlm_trace(
     if total_tokens:
         trace["total_tokens"] = total_tokens
 
-    output_path.write_text(json.dumps(trace, indent=2))
+    return trace
+
+
+def record_rlm_trace(
+    lm_name: str,
+    question: str,
+    output_path: Path,
+    signature: str = "context, question -> answer",
+    verbose: bool = True,
+    force: bool = False,
+    pretty: bool = False,
+    file_counts: dict[str, int] | None = None,
+    **input_kwargs: Any,
+) -> dict[str, Any]:
+    """Record a single RLM trace and save to JSON.
+
+    If output_path already holds a trace recorded from the same model,
+    signature, question and inputs, it is returned without calling the LLM.
+
+    Args:
+        lm_name: litellm-style model string (e.g., "openai/gpt-4o-mini")
+        question: The question for the RLM to answer
+        output_path: Where to save the JSON trace
+        signature: DSPy signature string
+        verbose: Whether to print progress
+        force: Re-record even if a matching trace already exists
+        pretty: Write indented JSON instead of compact JSON
+        file_counts: Number of source files joined into each package-source
+            input, keyed by input name, so they needn't be counted again
+        **input_kwargs: Additional input kwargs for the RLM (e.g., context=...)
+
+    Returns:
+        The trace dict that was saved
+    """
+    key = _cache_key(lm_name, signature, question, input_kwargs)
+    if not force:
+        cached = _load_cached_trace(output_path, key)
+        if cached is not None:
+            if verbose:
+                print(f"Unchanged: {output_path} (use --force to re-record)")
+            return cached
+
+    if dspy is None:
+        raise RuntimeError("Recording traces requires DSPy: uv pip install dspy")
+
+    # Use a thread-local LM override rather than dspy.configure() so that
+    # concurrent recordings against different models don't race.
+    lm = dspy.LM(lm_name)
+
+    # Build inputs
+    inputs: dict[str, Any] = {"question": question, **input_kwargs}
+
+    if verbose:
+        print(f"Running RLM with {lm_name}...")
+        print(f"  Question: {question[:100]}...")
+        print(f"  Inputs: {list(inputs.keys())}")
+
+    rlm = dspy.RLM(
+        signature=signature,
+        max_iterations=15,
+        verbose=verbose,
+    )
+    run_id = output_path.name.partition(".")[0]
+    log = _IterationLog(output_path.with_name(f"{run_id}.ndjson"), rlm.generate_action)
+
+    with dspy.context(lm=lm, callbacks=[log]):
+        start_time = time.time()
+        result = rlm(**inputs)
+        elapsed = time.time() - start_time
+
+    trace = build_trace(
+        result,
+        inputs,
+        run_id=run_id,
+        model=lm_name,
+        history=lm.history,
+        file_counts=file_counts,
+    )
+    trace["cache_key"] = key
+    total_tokens = trace.get("total_tokens")
+
+    _write_trace(trace, output_path, pretty=pretty)
+    _remove_other_formats(output_path)
+    # The full trace supersedes the progress log
+    log.path.unlink(missing_ok=True)
     if verbose:
         print(f"Recorded: {output_path}")
-        print(f"  Iterations: {len(trajectory)}")
+        print(f"  Iterations: {trace['iterations_used']}")
         print(f"  Time: {elapsed:.1f}s")
         if total_tokens:
             print(
@@ -193,29 +503,76 @@ def record_rlm_trace(
     return trace
 
 
+def _walk_py(directory: str) -> Iterator[str]:
+    """Yield paths of .py files under directory, in sorted path order."""
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_py(entry.path)
+        elif entry.name.endswith(".py") and entry.is_file():
+            yield entry.path
+
+
+@functools.cache
 def load_package_source(package_name: str) -> tuple[str, int]:
     """Load all .py source files from an installed package into a single string.
 
+    Cached per package, so demos that share a package (and therefore the
+    same context prompt prefix) reuse one copy of its source. The cache
+    doesn't stop two threads that miss it at once from both reading the
+    package, so main() loads each package before recording starts.
+
     Returns:
         (context_string, n_files) — concatenated source and file count
     """
-    import importlib
-
     mod = importlib.import_module(package_name)
-    src_dir = Path(mod.__file__).parent
-    py_files = sorted(src_dir.rglob("*.py"))
+    src_dir = os.path.dirname(mod.__file__)
 
-    parts = []
-    for f in py_files:
-        rel = f.relative_to(src_dir)
+    # Assemble raw bytes and decode once at the end, rather than decoding
+    # each file and joining a list of strings
+    buf = bytearray()
+    n_files = 0
+    for path in _walk_py(src_dir):
         try:
-            content = f.read_text(errors="ignore")
+            with open(path, "rb") as f:
+                content = f.read()
         except OSError:
             continue
-        parts.append(f"# --- {package_name}/{rel} ---\n{content}")
-
-    context = "\n\n".join(parts)
-    return context, len(py_files)
+        rel = os.path.relpath(path, src_dir)
+        if n_files:
+            buf += b"\n\n"
+        buf += f"{_FILE_HEADER}{package_name}/{rel} ---\n".encode()
+        buf += content
+        n_files += 1
+
+    return buf.decode(errors="ignore"), n_files
+
+
+def record_demo(
+    demo: dict[str, Any],
+    output_dir: Path,
+    force: bool = False,
+    fmt: str = "json",
+    pretty: bool = False,
+    compress: str | None = None,
+) -> dict[str, Any]:
+    """Load a demo's package source as context and record its trace."""
+    suffix = {"zstd": f".{fmt}.zst", "gzip": f".{fmt}.gz"}.get(compress, f".{fmt}")
+    pkg = demo["package"]
+    context, n_files = load_package_source(pkg)
+    print(f"  {n_files} files, {len(context):,d} chars ({len(context)/1000:.0f}K)")
+
+    return record_rlm_trace(
+        lm_name=demo["lm"],
+        question=demo["question"],
+        output_path=output_dir / f"{demo['name']}{suffix}",
+        signature=demo.get("signature", "context, question -> answer"),
+        force=force,
+        pretty=pretty,
+        file_counts={"context": n_files},
+        context=context,
+    )
 
 
 DEMOS: list[dict[str, Any]] = [
@@ -254,23 +611,56 @@ DEMOS: list[dict[str, Any]] = [
 
 def main() -> None:
     """Record demo traces."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("name", nargs="?", help="Record a single run by name")
+    parser.add_argument("--run", metavar="NAME", help="Record a single run by name")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-record even if a trace with the same inputs already exists",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        metavar="N",
+        help="Maximum number of demos to record concurrently (default: 8)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "msgpack"],
+        default="json",
+        help="Trace file format (msgpack requires the msgpack package)",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write indented JSON for human inspection",
+    )
+    parser.add_argument(
+        "--compress",
+        choices=["gzip", "zstd"],
+        help="Compress trace files (zstd requires the zstandard package)",
+    )
+    args = parser.parse_args()
+    target = args.run or args.name
+
+    # Check optional writers up front; otherwise a missing one only fails
+    # once a recording has been paid for and its trace is being written
+    if args.format == "msgpack" and importlib.util.find_spec("msgpack") is None:
+        parser.error("--format msgpack requires the msgpack package")
+    if args.compress == "zstd" and importlib.util.find_spec("zstandard") is None:
+        parser.error("--compress zstd requires the zstandard package")
+
     load_env_from_renviron()
     fix_deno_env()
 
     output_dir = Path("src/dspy_explorer/data/runs")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Allow recording a single run by name
-    target = None
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--run" and len(sys.argv) > 2:
-            target = sys.argv[2]
-        elif sys.argv[1] == "--help":
-            print(__doc__)
-            sys.exit(0)
-        else:
-            target = sys.argv[1]
-
     demos_to_run = DEMOS
     if target:
         demos_to_run = [d for d in DEMOS if d["name"] == target]
@@ -279,28 +669,43 @@ def main() -> None:
             print(f"Available: {', '.join(d['name'] for d in DEMOS)}")
             sys.exit(1)
 
+    # Read each distinct package's source once, before the demos that
+    # share it start concurrently and could both miss the cache. A package
+    # that fails to load is reported by each of its demos below.
+    for pkg in dict.fromkeys(d["package"] for d in demos_to_run):
+        print(f"Loading source for {pkg}...")
+        try:
+            load_package_source(pkg)
+        except (ImportError, OSError):
+            pass
+
+    # Each recording spends most of its time waiting on LLM API calls, so
+    # run the demos concurrently in threads.
     for demo in demos_to_run:
-        print(f"\n{'=' * 60}")
         print(f"Recording: {demo['name']}")
-        print(f"{'=' * 60}\n")
-        try:
-            # Load real package source as context
-            pkg = demo["package"]
-            print(f"Loading source for {pkg}...")
-            context, n_files = load_package_source(pkg)
-            print(f"  {n_files} files, {len(context):,d} chars ({len(context)/1000:.0f}K)")
-
-            record_rlm_trace(
-                lm_name=demo["lm"],
-                question=demo["question"],
-                output_path=output_dir / f"{demo['name']}.json",
-                signature=demo.get("signature", "context, question -> answer"),
-                context=context,
-            )
-        except Exception as e:
-            print(f"FAILED: {demo['name']}: {e}")
-            import traceback
-            traceback.print_exc()
+    print()
+
+    max_workers = max(1, min(args.jobs, len(demos_to_run)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                record_demo,
+                demo,
+                output_dir,
+                force=args.force,
+                fmt=args.format,
+                pretty=args.pretty,
+                compress=args.compress,
+            ): demo
+            for demo in demos_to_run
+        }
+        for future in as_completed(futures):
+            demo = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f"FAILED: {demo['name']}: {e}")
+                traceback.print_exc()
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ from pathlib import Path
 from shiny import App, Inputs, Outputs, Session, reactive
 
 from shinyreact import page_react, render_json, post_message
-from trace_data import list_available_runs, load_trace
+from trace_data import list_available_runs, load_trace, runs_dir, trace_ref
 
 
 def server(input: Inputs, output: Outputs, session: Session):
@@ -18,6 +18,12 @@ def server(input: Inputs, output: Outputs, session: Session):
         run_id = input.selected_run()
         if not run_id:
             return None
+        # JSON traces (plain or gzipped) are fetched by the browser straight
+        # from the static runs/ mount; other formats are decoded here and
+        # sent inline
+        ref = trace_ref(run_id)
+        if ref is not None:
+            return ref
         return load_trace(run_id)
 
     @reactive.effect
@@ -35,5 +41,8 @@ def server(input: Inputs, output: Outputs, session: Session):
 app = App(
     page_react(title="How RLMs Work — DSPy Explorer"),
     server,
-    static_assets=str(Path(__file__).parent / "www"),
+    static_assets={
+        "/runs": str(runs_dir()),
+        "/": str(Path(__file__).parent / "www"),
+    },
 )
@@ -2,63 +2,173 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import re
+import zlib
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    from dspy_explorer.trace_codecs import decode_trace
+except ImportError:
+    # The replay-only Shinylive copy of this module ships without the
+    # package, and reads plain (or gzipped) JSON traces only
+    decode_trace = None
 
-def _data_dir() -> Path:
+
+# Trace file suffixes, in order of preference when a run has several.
+_TRACE_SUFFIXES = (
+    ".json",
+    ".json.gz",
+    ".msgpack",
+    ".msgpack.gz",
+    ".json.zst",
+    ".msgpack.zst",
+)
+
+# Suffixes of traces the browser can fetch and parse itself, with the
+# DecompressionStream format needed to inflate them, if any
+_FETCHABLE_SUFFIXES = {".json": None, ".json.gz": "gzip"}
+
+# Valid run IDs; anything else (e.g. path separators) is rejected
+_RUN_ID_RE = re.compile(r"\A[A-Za-z0-9_-]+\Z")
+
+# Magic number at the start of every gzip member
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def runs_dir() -> Path:
     """Return the path to the bundled trace data directory."""
     return Path(__file__).parent / "data" / "runs"
 
 
+def _run_id(path: Path) -> str | None:
+    """Return the run_id for a trace file, or None if it isn't one."""
+    for suffix in _TRACE_SUFFIXES:
+        if path.name.endswith(suffix):
+            return path.name[: -len(suffix)]
+    return None
+
+
+def _read_trace(path: Path) -> dict[str, Any]:
+    """Read a trace file, detecting gzip, zstd, JSON or msgpack from its contents."""
+    data = path.read_bytes()
+    if data[:2] == _GZIP_MAGIC:
+        try:
+            data = gzip.decompress(data)
+        except (OSError, EOFError, zlib.error) as e:
+            raise ValueError(f"Invalid gzip trace: {path.name}") from e
+
+    if decode_trace is not None:
+        return decode_trace(data, path.name)
+    return json.loads(data)
+
+
+def _trace_path(run_id: str) -> Path | None:
+    """Return the trace file for run_id, in the preferred format if several."""
+    for suffix in _TRACE_SUFFIXES:
+        filepath = runs_dir() / f"{run_id}{suffix}"
+        if filepath.is_file():
+            return filepath
+    return None
+
+
+@lru_cache(maxsize=256)
+def _describe(n_iter: int, llm_calls: int) -> str:
+    """Return a run's listing description, shared across runs alike in size."""
+    if llm_calls > 1:
+        return f"{n_iter} iterations, {llm_calls} LLM calls"
+    return f"{n_iter} iterations"
+
+
+@lru_cache(maxsize=256)
+def _read_meta(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Read a trace's listing metadata, memoized on the file's mtime.
+
+    Listing only needs a few top-level fields, but getting them means
+    parsing the whole trace. Caching on (path, mtime) means each file is
+    parsed once per change rather than on every page load.
+    """
+    filepath = Path(path)
+    data = _read_trace(filepath)
+    run_id = _run_id(filepath)
+    n_iter = data.get("iterations_used") or len(data.get("iterations", []))
+    llm_calls = data.get("llm_calls_used", 1)
+
+    return {
+        "id": data.get("run_id", run_id),
+        "label": data.get("run_id", run_id),
+        "description": _describe(n_iter, llm_calls),
+        "question": data.get("question", ""),
+        "model": data.get("model", ""),
+        "iterations": n_iter,
+        "total_tokens": data.get("total_tokens"),
+    }
+
+
 def list_available_runs() -> list[dict[str, Any]]:
     """List available pre-recorded runs with metadata."""
-    data_dir = _data_dir()
+    data_dir = runs_dir()
     if not data_dir.is_dir():
         return []
 
+    run_ids = sorted({_run_id(f) for f in data_dir.iterdir()} - {None})
+
     runs = []
-    for f in sorted(data_dir.glob("*.json")):
+    for run_id in run_ids:
+        f = _trace_path(run_id)
+        if f is None:
+            continue
         try:
-            data = json.loads(f.read_text())
-            n_iter = data.get("iterations_used") or len(data.get("iterations", []))
-            llm_calls = data.get("llm_calls_used", 1)
-
-            if llm_calls > 1:
-                description = f"{n_iter} iterations, {llm_calls} LLM calls"
-            else:
-                description = f"{n_iter} iterations"
-
-            runs.append({
-                "id": data.get("run_id", f.stem),
-                "label": data.get("run_id", f.stem),
-                "description": description,
-                "question": data.get("question", ""),
-                "model": data.get("model", ""),
-                "iterations": n_iter,
-                "total_tokens": data.get("total_tokens"),
-            })
-        except (json.JSONDecodeError, KeyError):
+            runs.append(dict(_read_meta(str(f), f.stat().st_mtime_ns)))
+        except (ValueError, KeyError, ImportError, OSError):
             continue
 
     return runs
 
 
+def trace_ref(run_id: str) -> dict[str, str] | None:
+    """Return where a trace can be fetched from as a static file.
+
+    Only JSON traces, plain or gzipped, can be parsed directly by the
+    browser; gzipped ones are served as-is and come with an ``encoding`` of
+    ``"gzip"`` for the client to inflate them. For other formats, or an
+    invalid/unknown run_id, returns None and the trace must be sent inline
+    via load_trace(). The URL is relative to the app root, where runs_dir()
+    is expected to be mounted at ``runs/``.
+    """
+    if not _RUN_ID_RE.match(run_id):
+        return None
+
+    filepath = _trace_path(run_id)
+    if filepath is None:
+        return None
+    suffix = filepath.name[len(run_id):]
+    if suffix not in _FETCHABLE_SUFFIXES:
+        return None
+
+    ref = {"url": f"runs/{filepath.name}"}
+    encoding = _FETCHABLE_SUFFIXES[suffix]
+    if encoding is not None:
+        ref["encoding"] = encoding
+    return ref
+
+
 def load_trace(run_id: str) -> dict[str, Any] | None:
     """Load a specific trace by run_id.
 
     Validates run_id to prevent path traversal attacks.
     """
-    if not re.match(r"^[A-Za-z0-9_-]+$", run_id):
+    if not _RUN_ID_RE.match(run_id):
         return None
 
-    filepath = _data_dir() / f"{run_id}.json"
-    if not filepath.is_file():
+    filepath = _trace_path(run_id)
+    if filepath is None:
         return None
 
     try:
-        return json.loads(filepath.read_text())
-    except (json.JSONDecodeError, OSError):
+        return _read_trace(filepath)
+    except (ValueError, ImportError, OSError):
         return None
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from importlib.resources import files
 from pathlib import Path
 
 from shiny import App, Inputs, Outputs, Session, reactive
 
 from dspy_explorer.shinyreact import page_react, render_json, post_message
-from dspy_explorer.trace_data import list_available_runs, load_trace
+from dspy_explorer.trace_data import (
+    list_available_runs,
+    load_trace,
+    runs_dir,
+    trace_ref,
+)
 
 
 def server(input: Inputs, output: Outputs, session: Session):
@@ -22,6 +29,12 @@ def server(input: Inputs, output: Outputs, session: Session):
         run_id = input.selected_run()
         if not run_id:
             return None
+        # JSON traces (plain or gzipped) are fetched by the browser straight
+        # from the static runs/ mount; other formats are decoded here and
+        # sent inline
+        ref = trace_ref(run_id)
+        if ref is not None:
+            return ref
         return load_trace(run_id)
 
     # ---- Live Mode ----
@@ -41,14 +54,18 @@ def server(input: Inputs, output: Outputs, session: Session):
             })
 
 
-# Resolve static assets path
-www_dir = Path(__file__).parent.parent.parent / "www"
-if not www_dir.is_dir():
-    # Fallback for installed package
-    www_dir = Path(__file__).parent / "www"
+@lru_cache
+def _www_dir() -> Path:
+    """Resolve the built frontend assets, bundled or from a source checkout."""
+    www_dir = Path(str(files("dspy_explorer") / "www"))
+    if www_dir.is_dir():
+        return www_dir
+    # Fallback for running from a source checkout
+    return Path(__file__).parent.parent.parent / "www"
+
 
 app = App(
     page_react(title="How RLMs Work — DSPy Explorer"),
     server,
-    static_assets=str(www_dir),
+    static_assets={"/runs": str(runs_dir()), "/": str(_www_dir())},
 )
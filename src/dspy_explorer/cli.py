@@ -8,6 +8,7 @@ from pathlib import Path
 import click
 
 PAGES_URL = "https://jameshwade.github.io/dspy-explorer/"
+APP_PATH = str(Path(__file__).parent / "app.py")
 
 
 @click.group(invoke_without_command=True)
@@ -28,11 +29,21 @@ def open() -> None:
 @main.command()
 @click.option("--port", default=8000, help="Port to run on.")
 @click.option("--no-live", is_flag=True, help="Replay-only mode (no DSPy needed).")
-def run(port: int, no_live: bool) -> None:
+@click.option(
+    "--reload/--no-reload",
+    default=False,
+    help="Restart the app when its source changes (for development).",
+)
+def run(port: int, no_live: bool, reload: bool) -> None:
     """Run the explorer locally."""
-    app_path = str(Path(__file__).parent / "app.py")
     click.echo(f"Starting DSPy Explorer on http://localhost:{port}")
 
     from shiny import run_app
 
-    run_app(app_path, port=port, launch_browser=True)
+    run_app(
+        APP_PATH,
+        port=port,
+        launch_browser=True,
+        reload=reload,
+        dev_mode=reload,
+    )
@@ -2,15 +2,68 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import time
 from typing import Any
 
 from shiny import Session
 
+from dspy_explorer.rlm_steps import ActionCallback, iter_steps
 from dspy_explorer.shinyreact import post_message
 
 
+class _Flusher:
+    """Coalesce items into batched ``post_message()`` calls.
+
+    Items are sent as ``{"items": [...]}`` once max_batch have accumulated,
+    or max_ms after the first of a batch arrived, whichever comes first. A
+    burst of iterations then costs one websocket message and one React
+    update rather than one each. Must be used from the event loop's thread.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        type_: str,
+        max_batch: int = 4,
+        max_ms: float = 150,
+    ):
+        self.session = session
+        self.type_ = type_
+        self.max_batch = max_batch
+        self.max_ms = max_ms
+        self._items: list[Any] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._sends: set[asyncio.Task[None]] = set()
+
+    def append(self, item: Any) -> None:
+        self._items.append(item)
+        if len(self._items) >= self.max_batch:
+            self._send()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.max_ms / 1000, self._send)
+
+    def _send(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._items:
+            return
+        items, self._items = self._items, []
+        task = asyncio.create_task(
+            post_message(self.session, self.type_, {"items": items})
+        )
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    async def flush(self) -> None:
+        """Send anything still buffered and wait for every batch to go out."""
+        self._send()
+        await asyncio.gather(*self._sends)
+
+
 async def run_live_rlm(session: Session, config: dict[str, Any]) -> None:
     """Run a DSPy RLM query and stream results back to the client."""
     await post_message(session, "live_status", {"status": "running"})
@@ -33,7 +86,6 @@ async def run_live_rlm(session: Session, config: dict[str, Any]) -> None:
         # DSPy uses litellm-style model strings
         model_str = f"{provider}/{model}" if provider != "openai" else model
         lm = dspy.LM(model_str, **lm_kwargs)
-        dspy.configure(lm=lm)
 
         # Build RLM with signature
         signature = config.get("signature", "context, question -> answer")
@@ -49,21 +101,39 @@ async def run_live_rlm(session: Session, config: dict[str, Any]) -> None:
         if "context" in config and "context" not in inputs:
             inputs["context"] = config.get("context", "")
 
-        # Run it
-        result = rlm(**inputs)
+        # Stream each iteration to the client as the RLM takes it. The
+        # callback fires on the worker thread, so hand items to the loop.
+        loop = asyncio.get_running_loop()
+        flusher = _Flusher(session, "live_iteration")
+
+        def on_action(action: dict[str, Any]) -> None:
+            # REPL output only arrives with the final result
+            item = {
+                **action,
+                "output": "",
+                "success": True,
+                "is_final": "SUBMIT(" in action["code"],
+            }
+            loop.call_soon_threadsafe(flusher.append, item)
+
+        callback = ActionCallback(rlm.generate_action, on_action)
+
+        # Run it with a context-local LM rather than dspy.configure(), so
+        # concurrent sessions using different providers/keys don't clobber
+        # each other's global settings. The RLM blocks, so it runs off the
+        # event loop to let batches go out while it works.
+        def run() -> Any:
+            with dspy.context(lm=lm, callbacks=[callback]):
+                return rlm(**inputs)
+
+        try:
+            result = await asyncio.to_thread(run)
+        finally:
+            await flusher.flush()
 
         # Convert trajectory to our trace format
-        iterations = []
         trajectory = getattr(result, "trajectory", [])
-        for i, step in enumerate(trajectory):
-            iterations.append({
-                "iteration": i + 1,
-                "reasoning": step.get("reasoning", ""),
-                "code": step.get("code", ""),
-                "output": step.get("output", ""),
-                "success": not step.get("error", False),
-                "is_final": i == len(trajectory) - 1,
-            })
+        iterations = list(iter_steps(trajectory))
 
         trace = {
             "run_id": f"live-{int(time.time())}",
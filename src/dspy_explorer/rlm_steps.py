@@ -0,0 +1,89 @@
+"""Convert DSPy RLM steps to the explorer's iteration format.
+
+Shared by live mode and scripts/record_traces.py. Needs neither Shiny nor,
+until a callback is actually used, DSPy.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterator
+from typing import Any
+
+try:
+    from dspy.utils.callback import BaseCallback
+except ImportError:
+    BaseCallback = object
+
+# Markers in REPL output that indicate the iteration's code raised
+_ERROR_RE = re.compile(r"Traceback \(most recent call last\)|Error:|Exception:")
+
+
+def iter_steps(trajectory: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """Convert an RLM trajectory to the explorer's iteration format.
+
+    The final iteration is the one that calls SUBMIT, or the last one if
+    the RLM ran out of iterations.
+    """
+    last = len(trajectory) - 1
+    for i, step in enumerate(trajectory):
+        code = step.get("code", "")
+        output = step.get("output", "")
+        yield {
+            "iteration": i + 1,
+            "reasoning": step.get("reasoning", ""),
+            "code": code,
+            "output": output,
+            "success": _ERROR_RE.search(output) is None,
+            "is_final": "SUBMIT(" in code or i == last,
+        }
+
+
+class ActionCallback(BaseCallback):
+    """DSPy callback that reports each action an RLM takes, as it's taken.
+
+    The RLM only returns its trajectory once it finishes. Each call to its
+    action predictor (``rlm.generate_action``) carries a step's reasoning
+    and code, but not the REPL output, so on_action gets
+    ``{"iteration", "reasoning", "code"}``. Only that predictor's calls are
+    reported: modules wrapping it, or an RLM whose own signature outputs
+    ``code``, end with the same fields and would report each step again.
+    """
+
+    def __init__(
+        self,
+        predictor: Any,
+        on_action: Callable[[dict[str, Any]], None],
+    ):
+        self.predictor = predictor
+        self.on_action = on_action
+        self.n_iterations = 0
+        self._call_ids: set[str] = set()
+
+    def on_module_start(
+        self,
+        call_id: str,
+        instance: Any,
+        inputs: dict[str, Any],
+    ) -> None:
+        if instance is self.predictor:
+            self._call_ids.add(call_id)
+
+    def on_module_end(
+        self,
+        call_id: str,
+        outputs: Any | None,
+        exception: Exception | None = None,
+    ) -> None:
+        if call_id not in self._call_ids:
+            return
+        self._call_ids.discard(call_id)
+        code = getattr(outputs, "code", None)
+        if exception is not None or not isinstance(code, str):
+            return
+        self.n_iterations += 1
+        self.on_action({
+            "iteration": self.n_iterations,
+            "reasoning": getattr(outputs, "reasoning", ""),
+            "code": code,
+        })
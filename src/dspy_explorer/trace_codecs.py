@@ -0,0 +1,41 @@
+"""Decode trace files stored as zstd, msgpack or orjson-parsed JSON.
+
+These decoders live apart from trace_data so that its replay-only copy in
+shinylive-app/, which only serves plain JSON, doesn't reference them:
+shinylive export bundles every Pyodide package an app's files import.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Magic number at the start of every zstd frame
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def decode_trace(data: bytes, name: str) -> dict[str, Any]:
+    """Decode a trace file's bytes, detecting zstd, JSON or msgpack.
+
+    Raises ValueError for a corrupt file, and ImportError when it needs
+    zstandard or msgpack and they aren't installed.
+    """
+    if data[:4] == _ZSTD_MAGIC:
+        import zstandard
+
+        try:
+            data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Invalid zstd trace: {name}") from e
+
+    if data.lstrip()[:1] == b"{":
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+
+    import msgpack
+
+    return msgpack.unpackb(data)
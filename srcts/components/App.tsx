@@ -1,6 +1,14 @@
-import { useState, useCallback, useRef } from "react";
+import { useState, useCallback, useEffect, useRef } from "react";
 import { useShinyInput, useShinyOutput, useShinyMessageHandler } from "@posit/shiny-react";
-import type { TraceData, RunMeta, AppMode, LiveConfig, LiveStatus } from "@/lib/types";
+import type {
+  TraceData,
+  TraceOutput,
+  RunMeta,
+  AppMode,
+  LiveConfig,
+  LiveStatus,
+  LiveIterationBatch,
+} from "@/lib/types";
 import { Header } from "./Header";
 import { IntroPanel } from "./IntroPanel";
 import { ToolkitPanel } from "./ToolkitPanel";
@@ -12,6 +20,7 @@ import { LiveModePanel } from "./LiveModePanel";
 import { RunComparison } from "./RunComparison";
 import { usePlayback } from "@/hooks/usePlayback";
 import { usePhaseDetection } from "@/hooks/usePhaseDetection";
+import { useTraceData } from "@/hooks/useTraceData";
 import {
   Collapsible,
   CollapsibleContent,
@@ -24,6 +33,7 @@ export function App() {
   const [showOrientation, setShowOrientation] = useState(true);
   const [liveTrace, setLiveTrace] = useState<TraceData | null>(null);
   const [liveStatus, setLiveStatus] = useState<LiveStatus>({ status: "idle" });
+  const liveConfigRef = useRef<LiveConfig | null>(null);
 
   // Session-local storage for completed live runs
   const sessionTracesRef = useRef<Map<string, TraceData>>(new Map());
@@ -31,7 +41,8 @@ export function App() {
   const liveRunCounterRef = useRef(0);
 
   // Shiny communication
-  const [traceData] = useShinyOutput<TraceData>("trace_data", undefined);
+  const [traceOutput] = useShinyOutput<TraceOutput>("trace_data", undefined);
+  const { trace: traceData, error: traceError } = useTraceData(traceOutput);
   const [availableRuns] = useShinyOutput<RunMeta[]>("available_runs", []);
   const [selectedRun, setSelectedRun] = useShinyInput<string>("selected_run", "dspy-rlm-run-1");
   const [mode, setMode] = useShinyInput<AppMode>("mode", "replay");
@@ -39,7 +50,27 @@ export function App() {
     priority: "event",
   });
 
-  // Live mode message handlers
+  // Live mode message handlers. Iterations stream in batches while the run
+  // is in progress (without REPL output yet); live_result then replaces
+  // them with the complete trace.
+  useShinyMessageHandler("live_iteration", ({ items }: LiveIterationBatch) => {
+    setLiveTrace((prev) => {
+      const base: TraceData = prev ?? {
+        run_id: "live",
+        timestamp: "",
+        question: liveConfigRef.current?.question ?? "",
+        model: liveConfigRef.current?.model ?? "",
+        context_variables: [],
+        iterations: [],
+        final_answer: "",
+        iterations_used: 0,
+        llm_calls_used: 0,
+      };
+      const iterations = [...base.iterations, ...items];
+      return { ...base, iterations, iterations_used: iterations.length };
+    });
+  });
+
   useShinyMessageHandler("live_result", (data: TraceData) => {
     setLiveTrace(data);
 
@@ -77,6 +108,13 @@ export function App() {
 
   // Playback controls
   const playback = usePlayback(iterations.length);
+
+  // Follow a live run's latest iteration as it streams in
+  const followLive = mode === "live" && liveStatus.status === "running" && !sessionTrace;
+  const { jumpTo } = playback;
+  useEffect(() => {
+    if (followLive && iterations.length > 0) jumpTo(iterations.length - 1);
+  }, [followLive, iterations.length, jumpTo]);
   const phaseProgress = usePhaseDetection(iterations, playback.currentIndex);
   const annotatedIterations = phaseProgress.annotatedIterations;
 
@@ -114,6 +152,7 @@ export function App() {
 
   const handleStartLive = useCallback(
     (config: LiveConfig) => {
+      liveConfigRef.current = config;
       setStartLiveRun(config);
       setLiveTrace(null);
       playback.reset();
@@ -202,7 +241,7 @@ export function App() {
             ) : (
               <div className="text-center py-12 text-muted-foreground">
                 {mode === "replay"
-                  ? "Select a run to begin..."
+                  ? (traceError ?? "Select a run to begin...")
                   : "Configure and start a live run above."}
               </div>
             )}
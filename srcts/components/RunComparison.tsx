@@ -70,8 +70,17 @@ export function RunComparison({ runs, currentRun, onRunChange }: RunComparisonPr
                   </td>
                   {anyHasTokens && (
                     <td className="px-4 py-2 text-center">
-                      <span className="font-mono text-xs tabular-nums">
-                        {total > 0 ? formatTokens(total) : "\u2014"}
+                      <span
+                        className="font-mono text-xs tabular-nums"
+                        title={
+                          run.total_tokens?.estimated
+                            ? "Estimated locally; a lower bound on actual usage"
+                            : undefined
+                        }
+                      >
+                        {total > 0
+                          ? `${run.total_tokens?.estimated ? "\u2265 " : ""}${formatTokens(total)}`
+                          : "\u2014"}
                       </span>
                     </td>
                   )}
@@ -30,6 +30,9 @@ export function TokenBudget({
   const outputTotal = totalTokens?.output ?? 0;
   const grandTotal = inputTotal + outputTotal;
   const hasTokenData = grandTotal > 0;
+  // Local tiktoken counts only see part of each prompt, so they're a floor
+  const estimated = totalTokens?.estimated ?? false;
+  const prefix = estimated ? "\u2265 " : "";
 
   return (
     <div className="rounded-xl border bg-card overflow-hidden">
@@ -87,20 +90,39 @@ export function TokenBudget({
             </div>
 
             <div className="flex items-baseline justify-between">
-              <span className="text-2xl font-bold tabular-nums">{formatTokens(grandTotal)}</span>
-              <span className="text-xs text-muted-foreground">total tokens</span>
+              <span className="text-2xl font-bold tabular-nums">
+                {prefix}
+                {formatTokens(grandTotal)}
+              </span>
+              <span className="text-xs text-muted-foreground">
+                {estimated ? "estimated total tokens" : "total tokens"}
+              </span>
             </div>
 
             <div className="grid grid-cols-2 gap-2">
               <div className="text-center p-2 rounded-lg bg-muted/50">
-                <div className="text-sm font-semibold tabular-nums">{formatTokens(inputTotal)}</div>
+                <div className="text-sm font-semibold tabular-nums">
+                  {prefix}
+                  {formatTokens(inputTotal)}
+                </div>
                 <div className="text-xs text-muted-foreground">input</div>
               </div>
               <div className="text-center p-2 rounded-lg bg-muted/50">
-                <div className="text-sm font-semibold tabular-nums">{formatTokens(outputTotal)}</div>
+                <div className="text-sm font-semibold tabular-nums">
+                  {prefix}
+                  {formatTokens(outputTotal)}
+                </div>
                 <div className="text-xs text-muted-foreground">output</div>
               </div>
             </div>
+
+            {estimated && (
+              <p className="text-xs text-muted-foreground/80 leading-relaxed">
+                The provider reported no usage for this run, so tokens were counted
+                locally from the question and generated code. Prompt instructions and
+                REPL output aren&rsquo;t included, so actual usage is higher.
+              </p>
+            )}
           </div>
         )}
 
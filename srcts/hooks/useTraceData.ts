@@ -0,0 +1,56 @@
+import { useEffect, useState } from "react";
+import type { TraceData, TraceOutput } from "@/lib/types";
+
+interface TraceDataState {
+  trace?: TraceData;
+  error?: string;
+}
+
+/**
+ * Resolve the `trace_data` output to a trace. The server sends JSON traces
+ * as a URL to fetch from its static `runs/` mount, and other formats inline.
+ * Gzipped JSON traces are served as-is and inflated here. If a fetched trace
+ * can't be loaded or parsed, `error` describes why.
+ */
+export function useTraceData(output: TraceOutput | null | undefined): TraceDataState {
+  const ref = output && "url" in output ? output : null;
+  const url = ref?.url ?? null;
+  const encoding = ref?.encoding;
+  const [fetched, setFetched] = useState<({ url: string } & TraceDataState) | null>(null);
+
+  useEffect(() => {
+    if (!url) return;
+    let cancelled = false;
+
+    fetch(url)
+      .then((res) => {
+        if (!res.ok) throw new Error(`${res.status} ${res.statusText}`);
+        if (encoding && res.body) {
+          const body = res.body.pipeThrough(new DecompressionStream(encoding));
+          return new Response(body).json() as Promise<TraceData>;
+        }
+        return res.json() as Promise<TraceData>;
+      })
+      .then((trace) => {
+        if (!cancelled) setFetched({ url, trace });
+      })
+      .catch((err) => {
+        console.error(`Failed to load trace from ${url}:`, err);
+        if (!cancelled) {
+          const reason = err instanceof Error ? err.message : String(err);
+          setFetched({ url, error: `Couldn't load this trace (${reason}).` });
+        }
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [url, encoding]);
+
+  if (!output) return {};
+  if (url) {
+    if (!fetched || fetched.url !== url) return {};
+    return { trace: fetched.trace, error: fetched.error };
+  }
+  return { trace: output as TraceData };
+}
@@ -7,6 +7,8 @@ export interface ContextVariable {
 export interface TokenUsage {
   input: number;
   output: number;
+  /** True when counted locally with tiktoken rather than reported by the provider */
+  estimated?: boolean;
 }
 
 export interface Iteration {
@@ -39,6 +41,16 @@ export interface TraceData {
   total_tokens?: TokenUsage;
 }
 
+/** A trace the client should fetch itself, e.g. from the static runs/ mount */
+export interface TraceRef {
+  url: string;
+  /** Set when the file is compressed and must be inflated after fetching */
+  encoding?: "gzip";
+}
+
+/** The `trace_data` output: either the trace itself or where to fetch it */
+export type TraceOutput = TraceData | TraceRef;
+
 export interface RunMeta {
   id: string;
   label: string;
@@ -134,6 +146,11 @@ export const PROVIDERS: ProviderOption[] = [
   },
 ];
 
+/** A batch of iterations streamed while a live run is in progress */
+export interface LiveIterationBatch {
+  items: Iteration[];
+}
+
 export interface LiveStatus {
   status: "idle" | "running" | "complete" | "error";
   message?: string;
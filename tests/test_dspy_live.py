@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from dspy_explorer import dspy_live
+from dspy_explorer.dspy_live import _Flusher
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Capture post_message() calls as (type, payload) pairs."""
+    messages = []
+
+    async def post_message(session, type_, data):
+        await asyncio.sleep(0)
+        messages.append((type_, data))
+
+    monkeypatch.setattr(dspy_live, "post_message", post_message)
+    return messages
+
+
+def test_flusher_sends_full_batches_then_the_rest_in_order(sent):
+    async def main():
+        flusher = _Flusher(None, "live_iteration", max_batch=2, max_ms=60_000)
+        for i in range(5):
+            flusher.append(i)
+        await flusher.flush()
+
+    asyncio.run(main())
+    assert sent == [
+        ("live_iteration", {"items": [0, 1]}),
+        ("live_iteration", {"items": [2, 3]}),
+        ("live_iteration", {"items": [4]}),
+    ]
+
+
+def test_flusher_sends_a_partial_batch_after_max_ms(sent):
+    async def main():
+        flusher = _Flusher(None, "live_iteration", max_batch=4, max_ms=10)
+        flusher.append("a")
+        flusher.append("b")
+        await asyncio.sleep(0.1)
+        assert sent == [("live_iteration", {"items": ["a", "b"]})]
+        flusher.append("c")
+        await flusher.flush()
+
+    asyncio.run(main())
+    assert sent == [
+        ("live_iteration", {"items": ["a", "b"]}),
+        ("live_iteration", {"items": ["c"]}),
+    ]
+
+
+def test_flusher_flush_without_items_sends_nothing(sent):
+    async def main():
+        await _Flusher(None, "live_iteration").flush()
+
+    asyncio.run(main())
+    assert sent == []
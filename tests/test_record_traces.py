@@ -0,0 +1,138 @@
+import importlib.util
+import json
+import sys
+
+import pytest
+
+import record_traces
+from dspy_explorer import trace_data
+
+
+def test_writing_a_trace_removes_the_run_in_other_formats(tmp_path, monkeypatch):
+    monkeypatch.setattr(trace_data, "runs_dir", lambda: tmp_path)
+    (tmp_path / "x.json").write_text(json.dumps({"question": "OLD"}))
+    (tmp_path / "x.msgpack").write_bytes(b"")
+    (tmp_path / "y.json").write_text(json.dumps({"question": "other run"}))
+
+    path = tmp_path / "x.json.gz"
+    record_traces._write_trace({"question": "NEW", "iterations": []}, path)
+    record_traces._remove_other_formats(path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["x.json.gz", "y.json"]
+    assert trace_data.trace_ref("x") == {"url": "runs/x.json.gz", "encoding": "gzip"}
+    assert trace_data.load_trace("x")["question"] == "NEW"
+
+
+def test_failed_write_leaves_no_files(tmp_path):
+    path = tmp_path / "x.json"
+    with pytest.raises(TypeError):
+        record_traces._write_trace({"question": object()}, path)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    ("flags", "package"),
+    [(["--format", "msgpack"], "msgpack"), (["--compress", "zstd"], "zstandard")],
+)
+def test_optional_writers_are_required_before_recording(
+    flags, package, monkeypatch, capsys
+):
+    monkeypatch.setattr(sys, "argv", ["record_traces.py", *flags])
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name, *args: None if name == package else find_spec(name, *args),
+    )
+    monkeypatch.setattr(record_traces, "record_demo", pytest.fail)
+
+    with pytest.raises(SystemExit) as exc:
+        record_traces.main()
+    assert exc.value.code == 2
+    assert f"requires the {package} package" in capsys.readouterr().err
+
+
+TRACE = {
+    "run_id": "x",
+    "question": "Why?\nBecause — \"quoted\"",
+    "iterations": [
+        {"iteration": 1, "code": "print('a')\nprint('b')", "output": "a\nb"},
+        {"iteration": 2, "code": "SUBMIT(answer)", "output": ""},
+    ],
+    "final_answer": "",
+    "total_tokens": {"input": 10, "output": 2},
+    "cache_key": "abc",
+}
+
+
+@pytest.mark.parametrize("pretty", [False, True], ids=["compact", "pretty"])
+@pytest.mark.parametrize(
+    "suffix", [".json", ".json.gz", ".json.zst", ".msgpack", ".msgpack.gz"]
+)
+def test_write_then_load_cached_trace_round_trips(tmp_path, suffix, pretty):
+    if "zst" in suffix:
+        pytest.importorskip("zstandard")
+    if "msgpack" in suffix:
+        pytest.importorskip("msgpack")
+    path = tmp_path / f"x{suffix}"
+
+    record_traces._write_trace(TRACE, path, pretty=pretty)
+
+    assert record_traces._load_cached_trace(path, "abc") == TRACE
+    assert record_traces._load_cached_trace(path, "other") is None
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
+
+
+@pytest.mark.parametrize("pretty", [False, True], ids=["compact", "pretty"])
+def test_written_json_matches_the_json_module(tmp_path, pretty):
+    path = tmp_path / "x.json"
+    record_traces._write_trace(TRACE, path, pretty=pretty)
+    text = path.read_text(encoding="utf-8")
+
+    assert json.loads(text) == TRACE
+    if pretty:
+        assert json.loads(text) == json.loads(json.dumps(TRACE, indent=2))
+        assert text.startswith('{\n  "run_id": "x",\n  "question"')
+        assert '\n  "iterations": [\n    {\n      "iteration": 1,' in text
+    else:
+        assert "\n" not in text.replace("\\n", "")
+
+
+def test_written_json_with_no_iterations(tmp_path):
+    path = tmp_path / "x.json"
+    trace = {"run_id": "x", "iterations": [], "cache_key": "abc"}
+    record_traces._write_trace(trace, path, pretty=True)
+    assert record_traces._load_cached_trace(path, "abc") == trace
+
+
+def test_load_cached_trace_treats_missing_or_corrupt_files_as_misses(tmp_path):
+    assert record_traces._load_cached_trace(tmp_path / "x.json", "abc") is None
+    for name, data in [
+        ("x.json", b'{"cache_key": "abc"'),
+        ("x.json.gz", b"\x1f\x8bnot gzip"),
+        ("x.json.zst", b"\x28\xb5\x2f\xfdnot zstd"),
+    ]:
+        (tmp_path / name).write_bytes(data)
+        assert record_traces._load_cached_trace(tmp_path / name, "abc") is None
+
+
+def test_parse_renviron(tmp_path):
+    path = tmp_path / ".Renviron"
+    path.write_bytes(
+        b'DOUBLE="quoted value"\r\n'
+        b"SINGLE='single'\r\n"
+        b"INNER=ab'c\r\n"
+        b'MIXED="it\'s"\r\n'
+        b"  SPACED = plain  \r\n"
+        b"# COMMENT=1\r\n"
+        b"EMPTY=\r\n"
+        b"DOUBLE=second\r\n"
+    )
+
+    assert record_traces._parse_renviron(str(path), path.stat().st_mtime_ns) == {
+        "DOUBLE": "quoted value",
+        "SINGLE": "single",
+        "INNER": "ab'c",
+        "MIXED": "it's",
+        "SPACED": "plain",
+    }
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+import pytest
+
+from dspy_explorer.rlm_steps import ActionCallback, iter_steps
+
+
+def test_iter_steps_converts_trajectory():
+    trajectory = [
+        {"reasoning": "look", "code": "print(1)", "output": "1"},
+        {"reasoning": "oops", "code": "1/0", "output": "ZeroDivisionError: division by zero"},
+        {"reasoning": "done", "code": "SUBMIT(answer='x')", "output": ""},
+    ]
+    iterations = list(iter_steps(trajectory))
+
+    assert [it["iteration"] for it in iterations] == [1, 2, 3]
+    assert [it["success"] for it in iterations] == [True, False, True]
+    assert [it["is_final"] for it in iterations] == [False, False, True]
+    assert iterations[0] == {
+        "iteration": 1,
+        "reasoning": "look",
+        "code": "print(1)",
+        "output": "1",
+        "success": True,
+        "is_final": False,
+    }
+
+
+def test_iter_steps_marks_last_step_final_without_submit():
+    iterations = list(iter_steps([{"code": "x = 1"}, {"code": "y = 2"}]))
+    assert [it["is_final"] for it in iterations] == [False, True]
+    assert iterations[1]["reasoning"] == iterations[1]["output"] == ""
+
+
+def test_action_callback_reports_only_the_action_predictor():
+    predictor, wrapper = object(), object()
+    actions = []
+    callback = ActionCallback(predictor, actions.append)
+    outputs = SimpleNamespace(reasoning="r", code="print(1)")
+
+    # A module wrapping the predictor ends with the same outputs
+    callback.on_module_start("outer", wrapper, {})
+    callback.on_module_start("inner", predictor, {})
+    callback.on_module_end("inner", outputs)
+    callback.on_module_end("outer", outputs)
+
+    callback.on_module_start("failed", predictor, {})
+    callback.on_module_end("failed", None, RuntimeError("boom"))
+
+    callback.on_module_start("next", predictor, {})
+    callback.on_module_end("next", SimpleNamespace(reasoning="s", code="SUBMIT(1)"))
+
+    assert actions == [
+        {"iteration": 1, "reasoning": "r", "code": "print(1)"},
+        {"iteration": 2, "reasoning": "s", "code": "SUBMIT(1)"},
+    ]
+
+
+def test_action_callback_with_dspy_module_calls():
+    dspy = pytest.importorskip("dspy")
+    from dspy.utils.dummies import DummyLM
+
+    class Wrapper(dspy.Module):
+        def __init__(self):
+            super().__init__()
+            self.predict = dspy.Predict("question -> reasoning, code")
+
+        def forward(self, question):
+            return self.predict(question=question)
+
+    module = Wrapper()
+    actions = []
+    callback = ActionCallback(module.predict, actions.append)
+    lm = DummyLM([{"reasoning": "r", "code": "print(1)"}])
+
+    with dspy.context(lm=lm, callbacks=[callback]):
+        module(question="q")
+
+    assert actions == [{"iteration": 1, "reasoning": "r", "code": "print(1)"}]
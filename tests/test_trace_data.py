@@ -0,0 +1,46 @@
+import gzip
+import json
+
+import pytest
+
+from dspy_explorer import trace_data
+
+
+@pytest.fixture
+def runs(tmp_path, monkeypatch):
+    """Point trace_data at an empty runs directory."""
+    monkeypatch.setattr(trace_data, "runs_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def _trace(question):
+    return {"run_id": "x", "question": question, "iterations": []}
+
+
+def test_trace_path_prefers_json_when_several_formats_exist(runs):
+    (runs / "x.json.gz").write_bytes(gzip.compress(json.dumps(_trace("gz")).encode()))
+    (runs / "x.json").write_text(json.dumps(_trace("json")))
+
+    assert trace_data._trace_path("x") == runs / "x.json"
+    assert trace_data.trace_ref("x") == {"url": "runs/x.json"}
+    assert trace_data.load_trace("x")["question"] == "json"
+
+
+def test_trace_ref_for_gzipped_json(runs):
+    (runs / "x.json.gz").write_bytes(gzip.compress(json.dumps(_trace("gz")).encode()))
+
+    assert trace_data._trace_path("x") == runs / "x.json.gz"
+    assert trace_data.trace_ref("x") == {"url": "runs/x.json.gz", "encoding": "gzip"}
+    assert trace_data.load_trace("x")["question"] == "gz"
+
+
+def test_trace_ref_is_none_for_formats_the_browser_cant_parse(runs):
+    (runs / "x.msgpack").write_bytes(b"")
+
+    assert trace_data._trace_path("x") == runs / "x.msgpack"
+    assert trace_data.trace_ref("x") is None
+
+
+def test_trace_ref_rejects_unknown_and_invalid_run_ids(runs):
+    assert trace_data.trace_ref("missing") is None
+    assert trace_data.trace_ref("../x") is None